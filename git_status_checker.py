@@ -8,19 +8,80 @@ This script scans all repositories in the CDS-9 Group 6 folder and reports:
 3. Repositories where remote has updates available
 4. Overall summary of repository states
 
-Usage: python git_status_checker.py
+Usage: python git_status_checker.py BASE_PATH [--export-json [PATH]]
 """
 
+import functools
+import importlib.util
 import os
-import subprocess
+import re
+import signal
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from datetime import datetime
-import json
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Optional, Sequence, Union
+from dataclasses import dataclass, asdict
 
-@dataclass
+# asyncio, pygit2, json, orjson and datetime are imported where they are used,
+# keeping startup (e.g. --help from completion scripts or shell loops) cheap
+if TYPE_CHECKING:
+    import asyncio
+
+# Optional - in-process git status via libgit2; only probed here, imported on use
+HAVE_PYGIT2 = importlib.util.find_spec("pygit2") is not None
+
+BACKENDS = ("subprocess", "batch", "pygit2")
+
+# Seconds a single git command may run before it is killed
+GIT_TIMEOUT = 30
+
+# Arguments for the single status call made per repository
+_STATUS_ARGS = ("status", "--porcelain=v2", "--branch", "--untracked-files=all")
+
+# Reads repository paths on stdin and runs git status for each one from a single
+# shell process, framing each repository's output with start/exit markers. Frames
+# are matched to repositories by input position, so the path is never echoed back
+# through the shell. stderr is interleaved so a failing repository's message
+# reaches the report; the status parser ignores any line that is not a porcelain record
+_BATCH_STATUS_SCRIPT = (
+    'while IFS= read -r p; do '
+    "printf '===REPO===\\n'; "
+    f'git -C "$p" {" ".join(_STATUS_ARGS)} 2>&1; '
+    "printf '===EXIT===%d\\n' \"$?\"; "
+    'done'
+)
+
+# Ahead/behind header of `git status --porcelain=v2 --branch`
+_AB_RE = re.compile(rb"^# branch\.ab \+(\d+) -(\d+)$")
+
+@functools.lru_cache(maxsize=4096)
+def _is_git_repository(path: str) -> bool:
+    """Check for a .git entry; memoized since a scan is too short-lived for it to go stale"""
+    return os.path.lexists(os.path.join(path, ".git"))
+
+def _git_dirs(repo_path: Path) -> List[Path]:
+    """
+    Return the repository's git directory and, for a linked worktree, the shared
+    common directory. In worktrees and submodules .git is a file pointing elsewhere.
+    """
+    git_dir = repo_path / ".git"
+    if git_dir.is_file():
+        try:
+            line = git_dir.read_text(encoding="utf-8").splitlines()[0]
+        except (OSError, UnicodeDecodeError, IndexError):
+            return [git_dir]
+        if not line.startswith("gitdir: "):
+            return [git_dir]
+        git_dir = repo_path / line[8:].strip()
+    dirs = [git_dir]
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return dirs
+    dirs.append(git_dir / common)
+    return dirs
+
+@dataclass(slots=True)
 class RepoStatus:
     """Data class to hold repository status information"""
     name: str
@@ -29,147 +90,486 @@ class RepoStatus:
     has_unpushed_commits: bool = False
     has_remote_updates: bool = False
     current_branch: str = ""
-    uncommitted_files: List[str] = None
+    upstream_branch: str = ""
+    head_commit: str = ""
+    # Uncommitted entries as newline-separated "XY path" lines (XY is always two
+    # characters, as in `git status --porcelain`), decoded only for display/export
+    uncommitted_output: bytes = b""
     unpushed_commits_count: int = 0
-    remote_commits_count: int = 0
+    # None when the remote has commits that were never fetched, so they cannot be counted
+    remote_commits_count: Optional[int] = 0
     error: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.uncommitted_files is None:
-            self.uncommitted_files = []
 
 class GitStatusChecker:
     """Main class for checking git status across repositories"""
     
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, max_concurrent: Optional[int] = None, concurrent: bool = True,
+                 offline: bool = False, backend: Optional[str] = None, include_hidden: bool = False,
+                 max_fetch_age: float = 300):
         self.base_path = Path(base_path)
         self.repositories: List[RepoStatus] = []
+        self._upstream_cache: Dict[Tuple[str, str], Optional[Tuple[str, str]]] = {}
+        self.concurrent = concurrent
+        self.offline = offline
+        self.include_hidden = include_hidden
+        self.max_fetch_age = max_fetch_age
+        # Local state is read with one batched shell loop; Windows has no POSIX sh, so
+        # it gets one git process per repository. pygit2 is opt-in because libgit2's
+        # file list differs from git's (see read_repository_status_pygit2)
+        if backend is None:
+            backend = "subprocess" if os.name == "nt" else "batch"
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == "pygit2" and not HAVE_PYGIT2:
+            raise ValueError("The pygit2 backend requires pygit2 (pip install pygit2)")
+        if backend == "batch" and os.name == "nt":
+            raise ValueError("The batch backend requires a POSIX shell")
+        self.backend = backend
+        self._batch_status: Dict[str, Tuple[bool, List[bytes]]] = {}
+        # Repository checks are I/O-bound (git subprocesses + network), so allow
+        # more workers than CPUs
+        if max_concurrent is None:
+            max_concurrent = min(32, (os.cpu_count() or 1) * 2)
+        self.max_concurrent = max(1, max_concurrent)
+        # Many git processes run at once, so none of them may prompt on the shared
+        # terminal; a remote needing auth just fails the query instead.
+        # GIT_TERMINAL_PROMPT only covers git's own prompts; ssh asks for passphrases
+        # and host keys on /dev/tty itself, so it runs in BatchMode unless the user
+        # set GIT_SSH_COMMAND or GIT_SSH (this overrides core.sshCommand)
+        self._git_env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        if "GIT_SSH_COMMAND" not in os.environ and "GIT_SSH" not in os.environ:
+            self._git_env["GIT_SSH_COMMAND"] = "ssh -o BatchMode=yes"
     
-    def run_git_command(self, repo_path: Path, command: List[str]) -> Tuple[bool, str, str]:
+    async def run_git_command(self, repo_path: Path, command: Sequence[str],
+                              text: bool = True) -> Tuple[bool, Union[str, bytes], str]:
         """
         Run a git command in the specified repository
         
+        Args:
+            text: Decode stdout and drop its trailing newline; pass False to get the raw bytes
+        
         Returns:
             Tuple of (success, stdout, stderr)
         """
+        import asyncio
+        
         try:
-            result = subprocess.run(
-                ["git"] + command,
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
+            proc = await asyncio.create_subprocess_exec(
+                "git", *command,
+                cwd=str(repo_path),
+                env=self._git_env,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-            return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
-        except subprocess.TimeoutExpired:
-            return False, "", "Command timed out"
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=GIT_TIMEOUT)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return False, "" if text else b"", "Command timed out"
+            if text:
+                # Only the trailing newline is removed; leading whitespace can be significant
+                stdout = stdout.decode("utf-8", "replace")
+                stdout = stdout[:-1] if stdout.endswith("\n") else stdout
+            return proc.returncode == 0, stdout, stderr.decode("utf-8", "replace").strip()
         except Exception as e:
-            return False, "", str(e)
+            return False, "" if text else b"", str(e)
     
-    def is_git_repository(self, path: Path) -> bool:
+    def is_git_repository(self, path: str) -> bool:
         """Check if a directory is a git repository"""
-        return (path / ".git").exists()
-    
-    def get_current_branch(self, repo_path: Path) -> str:
-        """Get the current branch name"""
-        success, stdout, _ = self.run_git_command(repo_path, ["branch", "--show-current"])
-        return stdout if success else "unknown"
+        return _is_git_repository(str(path))
     
-    def check_uncommitted_changes(self, repo_path: Path) -> Tuple[bool, List[str]]:
-        """Check for uncommitted changes (modified, untracked, staged files)"""
-        success, stdout, _ = self.run_git_command(repo_path, ["status", "--porcelain"])
+    async def read_repository_status(self, repo_path: Path, status: RepoStatus) -> bool:
+        """
+        Read branch, upstream, ahead/behind counts and uncommitted files from a
+        single `git status --porcelain=v2 --branch` call into the status object
+        
+        Returns:
+            True if git status succeeded
+        """
+        # Kept as bytes: only branch names and file paths get decoded
+        success, stdout, stderr = await self.run_git_command(repo_path, _STATUS_ARGS, text=False)
         if not success:
-            return False, []
+            status.current_branch = "unknown"
+            status.error = stderr or "git status failed"
+            return False
         
-        files = []
-        for line in stdout.split('\n'):
-            if line.strip():
-                files.append(line.strip())
+        self.parse_status_lines(stdout.splitlines(), status)
+        return True
+    
+    async def read_status_batch(self, repo_paths: List[Path]) -> Dict[str, Tuple[bool, List[bytes]]]:
+        """
+        Run git status for every repository from one shell process instead of
+        spawning a subprocess per repository
+        
+        Each repository gets GIT_TIMEOUT seconds. If one stalls or the batch process
+        fails, the batch is stopped and repositories without a result are left for
+        check_repository to read with their own git process.
+        
+        Returns:
+            Dict mapping repository path to (success, porcelain output lines)
+        """
+        import asyncio
+        
+        results: Dict[str, Tuple[bool, List[bytes]]] = {}
+        # Paths are sent one per line, so a path containing a newline can't be framed
+        # and is left for check_repository to read with its own git process
+        repo_paths = [path for path in repo_paths if "\n" not in str(path)]
+        if not repo_paths:
+            return results
+        
+        stdin = b"".join(os.fsencode(str(path)) + b"\n" for path in repo_paths)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "sh", "-c", _BATCH_STATUS_SCRIPT,
+                env=self._git_env,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                # Own process group, so a stalled git child is killed along with the shell
+                start_new_session=True
+            )
+        except Exception:
+            return results
         
-        return len(files) > 0, files
+        async def feed() -> None:
+            # Written alongside reading so a long path list can't fill both pipes
+            try:
+                proc.stdin.write(stdin)
+                await proc.stdin.drain()
+                proc.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+        
+        writer = asyncio.create_task(feed())
+        loop = asyncio.get_running_loop()
+        pending = iter(repo_paths)
+        current: Optional[str] = None
+        lines: List[bytes] = []
+        deadline = loop.time() + GIT_TIMEOUT
+        try:
+            while True:
+                line = await asyncio.wait_for(
+                    proc.stdout.readline(), timeout=max(deadline - loop.time(), 0)
+                )
+                if not line:
+                    break
+                line = line.rstrip(b"\n")
+                if line == b"===REPO===":
+                    current = str(next(pending, ""))
+                    lines = []
+                    deadline = loop.time() + GIT_TIMEOUT
+                elif line.startswith(b"===EXIT===") and current:
+                    results[current] = (line[10:] == b"0", lines)
+                    current = None
+                else:
+                    lines.append(line)
+        except Exception:
+            # Timed out on one repository or the output was unreadable
+            pass
+        finally:
+            if proc.returncode is None:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            await proc.wait()
+            await writer
+        return results
+        
+        stdin = b"".join(os.fsencode(str(path)) + b"\n" for path in repo_paths)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "sh", "-c", _BATCH_STATUS_SCRIPT,
+                env=self._git_env,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(
+                    proc.communicate(stdin), timeout=GIT_TIMEOUT * len(repo_paths)
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return results, "Batch status timed out"
+        except Exception as e:
+            return results, f"Batch status failed: {e}"
+        
+        pending = iter(repo_paths)
+        current: Optional[str] = None
+        lines: List[bytes] = []
+        for line in stdout.splitlines():
+            if line == b"===REPO===":
+                current = str(next(pending, ""))
+                lines = []
+            elif line.startswith(b"===EXIT===") and current:
+                results[current] = (line[10:] == b"0", lines)
+                current = None
+            else:
+                lines.append(line)
+        return results, None
     
-    def check_unpushed_commits(self, repo_path: Path, branch: str) -> Tuple[bool, int]:
-        """Check for unpushed commits"""
-        if not branch or branch == "unknown":
-            return False, 0
+    def parse_status_lines(self, lines: Iterable[bytes], status: RepoStatus) -> None:
+        """Parse `git status --porcelain=v2 --branch` output lines into the status object"""
+        files: List[bytes] = []
+        for line in lines:
+            if line.startswith(b"# "):
+                if line.startswith(b"# branch.oid "):
+                    oid = line[13:].decode("ascii")
+                    status.head_commit = "" if oid == "(initial)" else oid
+                elif line.startswith(b"# branch.head "):
+                    head = line[14:].decode("utf-8", "replace")
+                    status.current_branch = "" if head == "(detached)" else head
+                elif line.startswith(b"# branch.upstream "):
+                    status.upstream_branch = line[18:].decode("utf-8", "replace")
+                else:
+                    match = _AB_RE.match(line)
+                    if match:
+                        status.unpushed_commits_count = int(match.group(1))
+                        # Behind count as known from the last fetch of the remote-tracking ref
+                        status.remote_commits_count = int(match.group(2))
+                continue
+            
+            if line.startswith(b"? "):
+                files.append(b"?? " + line[2:])
+            elif line.startswith(b"1 "):
+                fields = line.split(b" ", 8)
+                files.append(fields[1].replace(b".", b" ") + b" " + fields[8])
+            elif line.startswith(b"2 "):
+                fields = line.split(b" ", 9)
+                path, _, orig_path = fields[9].partition(b"\t")
+                files.append(fields[1].replace(b".", b" ") + b" " + orig_path + b" -> " + path)
+            elif line.startswith(b"u "):
+                fields = line.split(b" ", 10)
+                files.append(fields[1] + b" " + fields[10])
         
-        # First, try to get the upstream branch
-        success, upstream, _ = self.run_git_command(repo_path, ["rev-parse", "--abbrev-ref", f"{branch}@{{upstream}}"])
-        if not success:
-            # No upstream branch configured
-            return False, 0
+        status.uncommitted_output = b"\n".join(files)
+        status.has_uncommitted_changes = len(files) > 0
+        status.has_unpushed_commits = status.unpushed_commits_count > 0
+        status.has_remote_updates = status.remote_commits_count > 0
+    
+    def _pygit2_status_code(self, flags: int) -> str:
+        """Translate a libgit2 status bitmask into a porcelain-style XY code"""
+        import pygit2
         
-        # Check how many commits ahead we are
-        success, stdout, _ = self.run_git_command(repo_path, ["rev-list", "--count", f"{upstream}..{branch}"])
-        if not success:
-            return False, 0
+        if flags & pygit2.GIT_STATUS_CONFLICTED:
+            return "UU"
+        if flags == pygit2.GIT_STATUS_WT_NEW:
+            return "??"
+        
+        index_codes = (
+            (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+            (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+            (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+            (pygit2.GIT_STATUS_INDEX_RENAMED, "R"),
+            (pygit2.GIT_STATUS_INDEX_TYPECHANGE, "T"),
+        )
+        worktree_codes = (
+            (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+            (pygit2.GIT_STATUS_WT_DELETED, "D"),
+            (pygit2.GIT_STATUS_WT_RENAMED, "R"),
+            (pygit2.GIT_STATUS_WT_TYPECHANGE, "T"),
+        )
+        x = next((code for flag, code in index_codes if flags & flag), " ")
+        y = next((code for flag, code in worktree_codes if flags & flag), " ")
+        return x + y
+    
+    def read_repository_status_pygit2(self, repo_path: Path, status: RepoStatus) -> bool:
+        """
+        Read the same information as read_repository_status in-process with
+        libgit2, without spawning any git subprocess
+        
+        The file list is not identical to git's: entries are sorted by path,
+        non-UTF-8 file names get replacement characters instead of git's quoting,
+        and renames are listed as a deletion plus an addition.
+        
+        Returns:
+            True if the repository could be opened
+        """
+        import pygit2
         
         try:
-            count = int(stdout)
-            return count > 0, count
-        except ValueError:
-            return False, 0
+            repo = pygit2.Repository(str(repo_path))
+        except (pygit2.GitError, KeyError) as e:
+            status.current_branch = "unknown"
+            status.error = str(e) or "Could not open repository"
+            return False
+        
+        if repo.head_is_unborn:
+            head_ref = repo.references["HEAD"].target
+            status.current_branch = head_ref[len("refs/heads/"):] if head_ref.startswith("refs/heads/") else head_ref
+        elif repo.head_is_detached:
+            status.head_commit = str(repo.head.target)
+        else:
+            head = repo.head
+            status.current_branch = head.shorthand
+            status.head_commit = str(head.target)
+            
+            branch = repo.branches.local.get(head.shorthand)
+            upstream = branch.upstream if branch is not None else None
+            if upstream is not None:
+                status.upstream_branch = upstream.shorthand
+                ahead, behind = repo.ahead_behind(head.target, upstream.target)
+                status.unpushed_commits_count = ahead
+                # Behind count as known from the last fetch of the remote-tracking ref
+                status.remote_commits_count = behind
+        
+        files = []
+        for path, flags in sorted(repo.status().items()):
+            if flags == pygit2.GIT_STATUS_CURRENT or flags & pygit2.GIT_STATUS_IGNORED:
+                continue
+            files.append(f"{self._pygit2_status_code(flags)} {path}")
+        
+        status.uncommitted_output = "\n".join(files).encode("utf-8", "surrogateescape")
+        status.has_uncommitted_changes = len(files) > 0
+        status.has_unpushed_commits = status.unpushed_commits_count > 0
+        status.has_remote_updates = status.remote_commits_count > 0
+        return True
     
-    def check_remote_updates(self, repo_path: Path, branch: str) -> Tuple[bool, int]:
-        """Check if remote has updates available"""
-        if not branch or branch == "unknown":
-            return False, 0
+    async def resolve_upstream(self, repo_path: Path, branch: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolve the remote name and remote branch ref a local branch tracks
         
-        # Fetch latest changes from remote (without merging)
-        success, _, _ = self.run_git_command(repo_path, ["fetch", "--dry-run"])
-        if not success:
-            # Try without dry-run - some repositories might not support it
-            success, _, _ = self.run_git_command(repo_path, ["fetch"])
-            if not success:
-                return False, 0
+        Returns:
+            Tuple of (remote, remote_ref), or None if the branch has no upstream
+        """
+        key = (str(repo_path), branch)
+        if key in self._upstream_cache:
+            return self._upstream_cache[key]
         
-        # Check if remote branch exists
-        success, upstream, _ = self.run_git_command(repo_path, ["rev-parse", "--abbrev-ref", f"{branch}@{{upstream}}"])
-        if not success:
-            return False, 0
+        upstream = None
+        success, stdout, _ = await self.run_git_command(repo_path, [
+            "for-each-ref", "--format=%(upstream:remotename) %(upstream:remoteref)", f"refs/heads/{branch}"
+        ])
+        if success and " " in stdout:
+            remote, remote_ref = stdout.split(" ", 1)
+            if remote and remote_ref:
+                upstream = (remote, remote_ref)
         
-        # Check how many commits behind we are
-        success, stdout, _ = self.run_git_command(repo_path, ["rev-list", "--count", f"{branch}..{upstream}"])
-        if not success:
+        self._upstream_cache[key] = upstream
+        return upstream
+    
+    async def check_remote_updates(self, repo_path: Path, status: RepoStatus) -> Tuple[bool, Optional[int]]:
+        """
+        Check if remote has updates available (queries the remote without fetching)
+        
+        Returns:
+            Tuple of (has_updates, commits_behind); commits_behind is None when the
+            remote head has not been fetched and the count is therefore unknown
+        """
+        if not status.current_branch or not status.upstream_branch:
             return False, 0
         
-        try:
-            count = int(stdout)
-            return count > 0, count
-        except ValueError:
+        # If the remote cannot be queried, fall back to the remote-tracking ref
+        tracked = (status.remote_commits_count > 0, status.remote_commits_count)
+        
+        # A recent fetch means the remote-tracking ref is fresh enough; FETCH_HEAD's
+        # mtime records when that was, so no separate cache is needed. A worktree
+        # shares remote-tracking refs with the main checkout, so a fetch from either counts
+        fetched_at = None
+        for git_dir in _git_dirs(repo_path):
+            try:
+                mtime = os.stat(git_dir / "FETCH_HEAD").st_mtime
+            except OSError:
+                continue
+            fetched_at = mtime if fetched_at is None else max(fetched_at, mtime)
+        if fetched_at is not None and time.time() - fetched_at < self.max_fetch_age:
+            return tracked
+        
+        upstream = await self.resolve_upstream(repo_path, status.current_branch)
+        if upstream is None:
+            return tracked
+        remote, remote_ref = upstream
+        
+        # Ask the remote for its branch head - unlike fetch this leaves local refs untouched
+        success, stdout, _ = await self.run_git_command(repo_path, ["ls-remote", "--heads", remote, remote_ref])
+        if not success or not stdout:
+            return tracked
+        # "<sha>\t<ref>"; the hash length depends on the object format (SHA-1/SHA-256)
+        remote_sha = stdout.split("\n", 1)[0].split("\t", 1)[0]
+        
+        if not status.head_commit or status.head_commit == remote_sha:
             return False, 0
+        
+        # Count how many commits behind we are
+        success, stdout, _ = await self.run_git_command(
+            repo_path, ["rev-list", "--count", f"{status.head_commit}..{remote_sha}"]
+        )
+        if success:
+            try:
+                count = int(stdout)
+                return count > 0, count
+            except ValueError:
+                return tracked
+        
+        # Remote head has not been fetched yet: there are new commits, but how many
+        # cannot be known without fetching them
+        return True, None
     
-    def check_repository(self, repo_path: Path) -> RepoStatus:
+    async def check_repository(self, repo_path: Path) -> RepoStatus:
         """Check the status of a single repository"""
+        import asyncio
+        
         repo_name = repo_path.name
         status = RepoStatus(name=repo_name, path=str(repo_path))
         
         try:
-            # Get current branch
-            status.current_branch = self.get_current_branch(repo_path)
-            
-            # Check for uncommitted changes
-            has_changes, files = self.check_uncommitted_changes(repo_path)
-            status.has_uncommitted_changes = has_changes
-            status.uncommitted_files = files
+            # Branch, upstream, unpushed commits and uncommitted changes in one call
+            if self.backend == "pygit2":
+                # libgit2 calls block, so keep them off the event loop
+                ok = await asyncio.to_thread(self.read_repository_status_pygit2, repo_path, status)
+            elif self.backend == "batch":
+                # Output was already collected for all repositories by read_status_batch
+                result = self._batch_status.get(str(repo_path))
+                if result is None:
+                    # Not sent to the batch (path contains a newline) or the batch stopped early
+                    ok = await self.read_repository_status(repo_path, status)
+                elif result[0]:
+                    ok = True
+                    self.parse_status_lines(result[1], status)
+                else:
+                    ok = False
+                    status.current_branch = "unknown"
+                    output = b"\n".join(result[1]).decode("utf-8", "replace").strip()
+                    status.error = output or "git status failed"
+            else:
+                ok = await self.read_repository_status(repo_path, status)
+            if not ok:
+                return status
             
-            # Check for unpushed commits
-            has_unpushed, unpushed_count = self.check_unpushed_commits(repo_path, status.current_branch)
-            status.has_unpushed_commits = has_unpushed
-            status.unpushed_commits_count = unpushed_count
-            
-            # Check for remote updates
-            has_remote_updates, remote_count = self.check_remote_updates(repo_path, status.current_branch)
-            status.has_remote_updates = has_remote_updates
-            status.remote_commits_count = remote_count
+            # Query the remote for updates (offline mode keeps the last-fetch counts)
+            if not self.offline:
+                has_remote_updates, remote_count = await self.check_remote_updates(repo_path, status)
+                status.has_remote_updates = has_remote_updates
+                status.remote_commits_count = remote_count
             
         except Exception as e:
             status.error = str(e)
         
         return status
     
+    async def _bounded(self, sem: "asyncio.Semaphore", repo_path: Path) -> RepoStatus:
+        """Check a single repository, limited by the semaphore"""
+        async with sem:
+            print(f"📁 Checking repository: {repo_path.name}")
+            return await self.check_repository(repo_path)
+    
+    async def _check_repos_async(self, repo_paths: List[Path]) -> List[RepoStatus]:
+        """Check repositories concurrently, returning results in the order given"""
+        import asyncio
+        
+        if self.backend == "batch":
+            self._batch_status = await self.read_status_batch(repo_paths)
+        sem = asyncio.Semaphore(self.max_concurrent if self.concurrent else 1)
+        return list(await asyncio.gather(*(self._bounded(sem, item) for item in repo_paths)))
+    
     def scan_repositories(self) -> None:
         """Scan all repositories in the base path"""
+        import asyncio
+        
         print(f"🔍 Scanning repositories in: {self.base_path}")
         print("=" * 80)
         
@@ -177,21 +577,33 @@ class GitStatusChecker:
             print(f"❌ Error: Path {self.base_path} does not exist")
             return
         
-        repo_count = 0
-        for item in self.base_path.iterdir():
-            if item.is_dir() and self.is_git_repository(item):
-                print(f"📁 Checking repository: {item.name}")
-                status = self.check_repository(item)
-                self.repositories.append(status)
-                repo_count += 1
+        # DirEntry caches the file type from readdir, so files, symlinks and hidden
+        # entries are rejected without a stat; only the .git probe costs one
+        with os.scandir(self.base_path) as entries:
+            candidates = [
+                entry for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and (self.include_hidden or not entry.name.startswith('.'))
+            ]
+        # Sorted so the summary and JSON export are stable from run to run
+        repo_paths = sorted(
+            (Path(entry.path) for entry in candidates if self.is_git_repository(entry.path)),
+            key=lambda path: path.name
+        )
+        
+        self.repositories.extend(asyncio.run(self._check_repos_async(repo_paths)))
         
-        print(f"\n✅ Scanned {repo_count} repositories")
+        print(f"\n✅ Scanned {len(repo_paths)} repositories")
     
     def print_summary(self) -> None:
         """Print a summary of all repository statuses"""
-        print("\n" + "=" * 80)
-        print("📊 REPOSITORY STATUS SUMMARY")
-        print("=" * 80)
+        # Collect the whole report and write it once instead of one write per line
+        buf: List[str] = []
+        emit = buf.append
+        
+        emit("\n" + "=" * 80 + "\n")
+        emit("📊 REPOSITORY STATUS SUMMARY\n")
+        emit("=" * 80 + "\n")
         
         repos_with_uncommitted = []
         repos_with_unpushed = []
@@ -210,40 +622,47 @@ class GitStatusChecker:
         
         # Print repositories with uncommitted changes
         if repos_with_uncommitted:
-            print(f"\n🔄 REPOSITORIES WITH UNCOMMITTED CHANGES ({len(repos_with_uncommitted)}):")
-            print("-" * 60)
+            emit(f"\n🔄 REPOSITORIES WITH UNCOMMITTED CHANGES ({len(repos_with_uncommitted)}):\n")
+            emit("-" * 60 + "\n")
             for repo in repos_with_uncommitted:
-                print(f"  📁 {repo.name} (branch: {repo.current_branch})")
-                for file in repo.uncommitted_files[:5]:  # Show first 5 files
-                    print(f"    • {file}")
-                if len(repo.uncommitted_files) > 5:
-                    print(f"    ... and {len(repo.uncommitted_files) - 5} more files")
-                print()
+                emit(f"  📁 {repo.name} (branch: {repo.current_branch})\n")
+                # Only the first 5 files are shown, so only those get split and decoded
+                files = repo.uncommitted_output.split(b"\n", 5)
+                for file in files[:5]:
+                    emit(f"    • {file.decode('utf-8', 'replace')}\n")
+                if len(files) > 5:
+                    # The unsplit remainder only needs its lines counted
+                    remaining = files[5].count(b"\n") + 1
+                    emit(f"    ... and {remaining} more files\n")
+                emit("\n")
         
         # Print repositories with unpushed commits
         if repos_with_unpushed:
-            print(f"\n⬆️  REPOSITORIES WITH UNPUSHED COMMITS ({len(repos_with_unpushed)}):")
-            print("-" * 60)
+            emit(f"\n⬆️  REPOSITORIES WITH UNPUSHED COMMITS ({len(repos_with_unpushed)}):\n")
+            emit("-" * 60 + "\n")
             for repo in repos_with_unpushed:
-                print(f"  📁 {repo.name} (branch: {repo.current_branch})")
-                print(f"    • {repo.unpushed_commits_count} commit(s) ahead of remote")
-                print()
+                emit(f"  📁 {repo.name} (branch: {repo.current_branch})\n")
+                emit(f"    • {repo.unpushed_commits_count} commit(s) ahead of remote\n")
+                emit("\n")
         
         # Print repositories with remote updates
         if repos_with_remote_updates:
-            print(f"\n⬇️  REPOSITORIES WITH REMOTE UPDATES AVAILABLE ({len(repos_with_remote_updates)}):")
-            print("-" * 60)
+            emit(f"\n⬇️  REPOSITORIES WITH REMOTE UPDATES AVAILABLE ({len(repos_with_remote_updates)}):\n")
+            emit("-" * 60 + "\n")
             for repo in repos_with_remote_updates:
-                print(f"  📁 {repo.name} (branch: {repo.current_branch})")
-                print(f"    • {repo.remote_commits_count} commit(s) behind remote")
-                print()
+                emit(f"  📁 {repo.name} (branch: {repo.current_branch})\n")
+                if repo.remote_commits_count is None:
+                    emit("    • new commits on remote (not fetched)\n")
+                else:
+                    emit(f"    • {repo.remote_commits_count} commit(s) behind remote\n")
+                emit("\n")
         
         # Print repositories with errors
         if repos_with_errors:
-            print(f"\n❌ REPOSITORIES WITH ERRORS ({len(repos_with_errors)}):")
-            print("-" * 60)
+            emit(f"\n❌ REPOSITORIES WITH ERRORS ({len(repos_with_errors)}):\n")
+            emit("-" * 60 + "\n")
             for repo in repos_with_errors:
-                print(f"  📁 {repo.name}: {repo.error}")
+                emit(f"  📁 {repo.name}: {repo.error}\n")
         
         # Print clean repositories
         clean_repos = [
@@ -255,46 +674,50 @@ class GitStatusChecker:
         ]
         
         if clean_repos:
-            print(f"\n✅ CLEAN REPOSITORIES ({len(clean_repos)}):")
-            print("-" * 60)
+            emit(f"\n✅ CLEAN REPOSITORIES ({len(clean_repos)}):\n")
+            emit("-" * 60 + "\n")
             for repo in clean_repos:
-                print(f"  📁 {repo.name} (branch: {repo.current_branch})")
+                emit(f"  📁 {repo.name} (branch: {repo.current_branch})\n")
         
         # Overall statistics
-        print(f"\n📈 OVERALL STATISTICS:")
-        print("-" * 60)
-        print(f"  Total repositories: {len(self.repositories)}")
-        print(f"  Repositories with uncommitted changes: {len(repos_with_uncommitted)}")
-        print(f"  Repositories with unpushed commits: {len(repos_with_unpushed)}")
-        print(f"  Repositories with remote updates: {len(repos_with_remote_updates)}")
-        print(f"  Repositories with errors: {len(repos_with_errors)}")
-        print(f"  Clean repositories: {len(clean_repos)}")
+        emit(f"\n📈 OVERALL STATISTICS:\n")
+        emit("-" * 60 + "\n")
+        emit(f"  Total repositories: {len(self.repositories)}\n")
+        emit(f"  Repositories with uncommitted changes: {len(repos_with_uncommitted)}\n")
+        emit(f"  Repositories with unpushed commits: {len(repos_with_unpushed)}\n")
+        emit(f"  Repositories with remote updates: {len(repos_with_remote_updates)}\n")
+        emit(f"  Repositories with errors: {len(repos_with_errors)}\n")
+        emit(f"  Clean repositories: {len(clean_repos)}\n")
+        
+        sys.stdout.write("".join(buf))
     
     def export_to_json(self, output_file: str) -> None:
         """Export results to JSON file"""
+        from datetime import datetime
+        
+        repositories = []
+        for repo in self.repositories:
+            repo_data = asdict(repo)
+            # Decode the raw status lines once, at the JSON boundary
+            del repo_data["uncommitted_output"]
+            repo_data["uncommitted_files"] = repo.uncommitted_output.decode("utf-8", "replace").splitlines()
+            repositories.append(repo_data)
+        
         data = {
             "scan_timestamp": datetime.now().isoformat(),
             "base_path": str(self.base_path),
-            "repositories": []
+            "repositories": repositories
         }
         
-        for repo in self.repositories:
-            repo_data = {
-                "name": repo.name,
-                "path": repo.path,
-                "current_branch": repo.current_branch,
-                "has_uncommitted_changes": repo.has_uncommitted_changes,
-                "has_unpushed_commits": repo.has_unpushed_commits,
-                "has_remote_updates": repo.has_remote_updates,
-                "uncommitted_files": repo.uncommitted_files,
-                "unpushed_commits_count": repo.unpushed_commits_count,
-                "remote_commits_count": repo.remote_commits_count,
-                "error": repo.error
-            }
-            data["repositories"].append(repo_data)
-        
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        try:
+            import orjson  # optional - faster JSON export when installed
+        except ImportError:
+            import json
+            with open(output_file, 'w') as f:
+                json.dump(data, f, indent=2)
+        else:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         print(f"\n💾 Results exported to: {output_file}")
 
@@ -302,6 +725,11 @@ def main():
     """Main function"""
     import argparse
     
+    # Emit UTF-8 regardless of the console code page (e.g. cp1252 on Windows),
+    # so the emoji output never raises UnicodeEncodeError
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    
     # Set up command line argument parsing
     parser = argparse.ArgumentParser(
         description="Git Status Checker for CDS Group 6 Repositories",
@@ -311,6 +739,7 @@ Examples:
   python3 git_status_checker.py /path/to/your/cds-group-6
   python3 git_status_checker.py ~/Documents/github/cds-9-group-6
   python3 git_status_checker.py ~/Projects/cds-9-group-6
+  python3 git_status_checker.py ~/Projects/cds-9-group-6 --export-json report.json
         """
     )
     
@@ -319,6 +748,56 @@ Examples:
         help='Base directory containing CDS Group 6 repositories (REQUIRED - specify your local path)'
     )
     
+    parser.add_argument(
+        '--max-concurrent',
+        type=int,
+        metavar='N',
+        default=None,
+        help='Maximum number of repositories to check at once (default: 2x CPU count, capped at 32)'
+    )
+    
+    parser.add_argument(
+        '--no-concurrent',
+        action='store_true',
+        help='Check repositories one at a time'
+    )
+    
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Do not query remotes; remote updates are reported as of the last fetch'
+    )
+    
+    parser.add_argument(
+        '--max-fetch-age',
+        type=float,
+        metavar='SECONDS',
+        default=300,
+        help='Skip querying the remote if the repository was fetched within this many seconds '
+             '(default: 300, 0 always queries)'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default=None,
+        help='How to read local repository state (default: batch; subprocess on Windows)'
+    )
+    
+    parser.add_argument(
+        '--include-hidden',
+        action='store_true',
+        help='Also scan hidden directories (names starting with a dot)'
+    )
+    
+    parser.add_argument(
+        '--export-json',
+        nargs='?',
+        const='auto',
+        metavar='PATH',
+        help='Export results to JSON (default file: git_status_report_<timestamp>.json)'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -327,6 +806,8 @@ Examples:
     
     args = parser.parse_args()
     
+    from datetime import datetime
+    
     # Expand user path (handles ~ notation)
     base_path = os.path.expanduser(args.base_path)
     
@@ -344,24 +825,33 @@ Examples:
         print(f"❌ Error: '{base_path}' is not a directory!")
         sys.exit(1)
     
+    # Create checker instance (rejects backends unavailable on this system)
+    try:
+        checker = GitStatusChecker(
+            base_path,
+            max_concurrent=args.max_concurrent,
+            concurrent=not args.no_concurrent,
+            offline=args.offline,
+            backend=args.backend,
+            include_hidden=args.include_hidden,
+            max_fetch_age=args.max_fetch_age
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    
     print("🚀 Git Status Checker for CDS Group 6 Repositories")
     print(f"⏰ Scan started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"📁 Scanning: {base_path}")
     
-    # Create checker instance and run scan
-    checker = GitStatusChecker(base_path)
+    # Run scan
     checker.scan_repositories()
     checker.print_summary()
     
-    # Ask if user wants to export to JSON
-    try:
-        export_choice = input("\n💡 Would you like to export results to JSON? (y/n): ").lower().strip()
-        if export_choice in ['y', 'yes']:
+    if args.export_json:
+        output_file = args.export_json
+        if output_file == 'auto':
             output_file = f"git_status_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            checker.export_to_json(output_file)
-    except (EOFError, KeyboardInterrupt):
-        print("\n💡 Skipping JSON export (non-interactive mode)")
-        pass
+        checker.export_to_json(output_file)
     
     print("\n🎉 Scan completed!")
 